@@ -2,18 +2,43 @@
 Etsy Help Center Auditor - Streamlit Web Application
 """
 
+import asyncio
+import hashlib
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from pathlib import Path
+from typing import NamedTuple
+
+import pandas as pd
 import streamlit as st
 
 from auditor import (
     ZendeskClient,
     ContentAnalyzer,
     UIVerifier,
+    ResultCache,
     generate_report,
 )
+from auditor.content_analyzer import AUDIT_PROMPT_VERSION, AnalysisResult, Issue
+from auditor.zendesk_client import parse_article_ref
+
+
+class AuditHistoryItem(NamedTuple):
+    """Compact audit history entry kept in session state."""
+    title: str
+    score: int
+    issues: int
+    url: str
 
 
+@st.cache_data(show_spinner=False)
 def get_secret(key: str, default: str = "") -> str:
+    """Look up a secret from Streamlit secrets, falling back to the environment.
+
+    Secrets do not change while the app runs, so the lookup is memoized.
+    """
     try:
         if hasattr(st, 'secrets') and key in st.secrets:
             return str(st.secrets[key])
@@ -28,17 +53,94 @@ st.set_page_config(
     layout="wide",
 )
 
-st.markdown("""
-<style>
-    .score-excellent { color: #28a745; font-size: 2em; font-weight: bold; }
-    .score-good { color: #5cb85c; font-size: 2em; font-weight: bold; }
-    .score-needswork { color: #f0ad4e; font-size: 2em; font-weight: bold; }
-    .score-critical { color: #d9534f; font-size: 2em; font-weight: bold; }
-    .issue-critical { background-color: #f8d7da; padding: 10px; border-radius: 5px; margin: 5px 0; }
-    .issue-warning { background-color: #fff3cd; padding: 10px; border-radius: 5px; margin: 5px 0; }
-    .issue-suggestion { background-color: #d1ecf1; padding: 10px; border-radius: 5px; margin: 5px 0; }
-</style>
-""", unsafe_allow_html=True)
+
+@st.cache_data(show_spinner=False)
+def load_css() -> str:
+    """Read the app stylesheet once per process."""
+    return (Path(__file__).parent / "static" / "audit.css").read_text()
+
+
+# Streamlit drops elements a full rerun does not emit again, so the styles
+# are re-sent on every full run. Fragment reruns skip this entirely.
+st.html(f"<style>{load_css()}</style>")
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_article(_client, subdomain: str, email: str, url_or_id: str):
+    """Fetch an article, memoized per Zendesk account and URL/ID.
+
+    The client itself (and with it the API token) is excluded from the
+    cache key; subdomain and email keep accounts from sharing entries.
+    """
+    return _client.get_article(url_or_id)
+
+
+@st.cache_resource
+def get_result_cache() -> ResultCache:
+    """On-disk cache that keeps analyses across app restarts."""
+    return ResultCache(os.getenv("AUDIT_CACHE_DIR", "/tmp/audit-cache"))
+
+
+class _UncachedAnalysis(Exception):
+    """Carries a failed analysis out of _analyze_cached so it is not memoized."""
+
+    def __init__(self, result: AnalysisResult):
+        super().__init__(result.issues[0].description if result.issues else "")
+        self.result = result
+
+
+def _is_error_result(result: AnalysisResult) -> bool:
+    """Whether the result is the analyzer's placeholder for a failed analysis."""
+    return result.overall_score == 0 and result.audience_detected == "Unknown"
+
+
+@st.cache_data(ttl=86400, show_spinner=False, max_entries=500)
+def _analyze_cached(_analyzer, _article, body_sha256: str, analyzer_version: str,
+                    article_title: str, declared_segment: str, html_url: str,
+                    section_name: str) -> dict:
+    """Run the Claude analysis, memoized on the article body hash and the
+    metadata that goes into the prompt.
+
+    Misses here fall through to the analyzer's on-disk result cache
+    before calling Claude. Failed analyses are raised rather than returned,
+    since Streamlit does not cache a call that raises.
+    """
+    result = _analyzer.analyze(_article)
+    if _is_error_result(result):
+        raise _UncachedAnalysis(result)
+    return asdict(result)
+
+
+def analyze_article(analyzer, article) -> AnalysisResult:
+    """Analyze an article, reusing a cached result if the content is unchanged."""
+    body_sha256 = hashlib.sha256(article.body.encode()).hexdigest()
+    try:
+        data = _analyze_cached(
+            analyzer,
+            article,
+            body_sha256,
+            f"{analyzer.model}:{AUDIT_PROMPT_VERSION}",
+            article.title,
+            article.audience,
+            article.html_url,
+            article.section_name or "",
+        )
+    except _UncachedAnalysis as e:
+        return e.result
+    data["issues"] = [Issue(**issue) for issue in data["issues"]]
+    return AnalysisResult(**data)
+
+
+@st.cache_resource
+def get_zendesk_client(subdomain: str, email: str, api_token: str) -> ZendeskClient:
+    """Share one client, and its connection pool, across sessions per account."""
+    return ZendeskClient(subdomain=subdomain, email=email, api_token=api_token)
+
+
+@st.cache_resource
+def get_ui_verifier() -> UIVerifier:
+    """UIVerifier holds no per-user state, so one instance serves every session."""
+    return UIVerifier()
 
 
 def init_session_state():
@@ -46,59 +148,74 @@ def init_session_state():
         st.session_state.zendesk_client = None
     if "analyzer" not in st.session_state:
         st.session_state.analyzer = None
-    if "ui_verifier" not in st.session_state:
-        st.session_state.ui_verifier = UIVerifier()
     if "audit_history" not in st.session_state:
-        st.session_state.audit_history = []
+        # Bounded so long sessions don't grow session state without limit
+        st.session_state.audit_history = deque(maxlen=50)
     if "connected" not in st.session_state:
         st.session_state.connected = False
 
 
+@st.fragment
 def connect_services():
-    with st.sidebar:
-        st.header("🔐 Configuration")
-
-        zendesk_email = get_secret("ZENDESK_EMAIL")
-        zendesk_token = get_secret("ZENDESK_API_TOKEN")
-        anthropic_key = get_secret("ANTHROPIC_API_KEY")
-
-        zendesk_email = st.text_input("Zendesk Email", value=zendesk_email)
-        zendesk_token = st.text_input("Zendesk API Token", value=zendesk_token, type="password")
-        anthropic_key = st.text_input("Anthropic API Key", value=anthropic_key, type="password")
-
-        if st.button("Connect", type="primary"):
-            with st.spinner("Connecting..."):
-                try:
-                    client = ZendeskClient(
-                        subdomain="etsy",
-                        email=zendesk_email,
-                        api_token=zendesk_token
-                    )
-                    if not client.test_connection():
-                        st.error("Failed to connect to Zendesk.")
-                        return
-                    analyzer = ContentAnalyzer(api_key=anthropic_key)
-                    st.session_state.zendesk_client = client
-                    st.session_state.analyzer = analyzer
-                    st.session_state.connected = True
-                    st.success("Connected!")
-                except Exception as e:
-                    st.error(f"Error: {str(e)}")
-
+    st.header("🔐 Configuration")
+
+    zendesk_email = get_secret("ZENDESK_EMAIL")
+    zendesk_token = get_secret("ZENDESK_API_TOKEN")
+    anthropic_key = get_secret("ANTHROPIC_API_KEY")
+
+    zendesk_email = st.text_input("Zendesk Email", value=zendesk_email)
+    zendesk_token = st.text_input("Zendesk API Token", value=zendesk_token, type="password")
+    anthropic_key = st.text_input("Anthropic API Key", value=anthropic_key, type="password")
+
+    if st.button("Connect", type="primary"):
+        with st.spinner("Connecting..."):
+            try:
+                client = get_zendesk_client(
+                    subdomain="etsy",
+                    email=zendesk_email,
+                    api_token=zendesk_token
+                )
+                if not client.test_connection():
+                    st.error("Failed to connect to Zendesk.")
+                    return
+                analyzer = ContentAnalyzer(api_key=anthropic_key, cache=get_result_cache())
+                st.session_state.zendesk_client = client
+                st.session_state.analyzer = analyzer
+                st.session_state.connected = True
+            except Exception as e:
+                st.error(f"Error: {str(e)}")
         if st.session_state.connected:
-            st.success("✓ Connected")
-        else:
-            st.warning("Not connected")
+            # Rerun the whole app, not just this fragment, so the tabs
+            # pick up the new connection
+            st.rerun()
+
+    if st.session_state.connected:
+        st.success("✓ Connected")
+    else:
+        st.warning("Not connected")
+
+    if st.button("🔄 Refresh Articles", help="Re-fetch articles from Zendesk instead of using cached copies"):
+        _fetch_article.clear()
+        # Section names go into the prompt too, so don't keep stale ones
+        if st.session_state.zendesk_client is not None:
+            st.session_state.zendesk_client.clear_section_cache()
+
+
+# Score thresholds and their CSS classes, highest first
+_SCORE_BUCKETS = (
+    (90, "score-excellent"),
+    (75, "score-good"),
+    (60, "score-needswork"),
+    (0, "score-critical"),
+)
 
 
 def render_score_card(report):
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        score_class = (
-            "score-excellent" if report.overall_score >= 90
-            else "score-good" if report.overall_score >= 75
-            else "score-needswork" if report.overall_score >= 60
-            else "score-critical"
+        score_class = next(
+            (cls for threshold, cls in _SCORE_BUCKETS if report.overall_score >= threshold),
+            "score-critical",
         )
         st.markdown(f"<div class='{score_class}'>{report.overall_score}/100</div>", unsafe_allow_html=True)
         st.caption(report.quality_rating)
@@ -110,20 +227,25 @@ def render_score_card(report):
         st.metric("Suggestions", len(report.suggestions))
 
 
+_ICONS = {"critical": "🔴", "warning": "🟡", "suggestion": "🔵"}
+
+
 def render_issues(issues, category_name):
     if not issues:
         st.success(f"No {category_name.lower()} issues!")
         return
+    # One markdown element for the whole list instead of one per issue
+    parts = []
     for issue in issues:
-        css_class = f"issue-{issue.severity}"
-        icon = {"critical": "🔴", "warning": "🟡", "suggestion": "🔵"}.get(issue.severity, "⚪")
-        st.markdown(f"""
-        <div class='{css_class}'>
-            <strong>{icon} {issue.description}</strong>
-            {f"<br><em>Location:</em> {issue.location}" if issue.location else ""}
-            {f"<br><em>Fix:</em> {issue.recommendation}" if issue.recommendation else ""}
-        </div>
-        """, unsafe_allow_html=True)
+        icon = _ICONS.get(issue.severity, "⚪")
+        location = f"<br><em>Location:</em> {issue.location}" if issue.location else ""
+        fix = f"<br><em>Fix:</em> {issue.recommendation}" if issue.recommendation else ""
+        parts.append(
+            f"<div class='issue-{issue.severity}'>"
+            f"<strong>{icon} {issue.description}</strong>{location}{fix}"
+            f"</div>"
+        )
+    st.markdown("".join(parts), unsafe_allow_html=True)
 
 
 def audit_article(url_or_id: str):
@@ -133,146 +255,267 @@ def audit_article(url_or_id: str):
 
     client = st.session_state.zendesk_client
     analyzer = st.session_state.analyzer
-    ui_verifier = st.session_state.ui_verifier
+    ui_verifier = get_ui_verifier()
 
     with st.spinner("Fetching article..."):
         try:
-            article = client.get_article(url_or_id)
+            article = _fetch_article(client, client.subdomain, client.email, url_or_id)
         except Exception as e:
             st.error(f"Fetch failed: {str(e)}")
             return None
 
-    with st.spinner("Analyzing with Claude..."):
-        try:
-            analysis = analyzer.analyze(article)
-        except Exception as e:
-            st.error(f"Analysis failed: {type(e).__name__}: {str(e)}")
-            return None
-
-    with st.spinner("Verifying UI..."):
-        try:
-            ui_report = ui_verifier.verify_article(article.body)
-        except Exception:
-            ui_report = None
+    # UI verification is local and independent of the Claude call, so it
+    # runs on a worker thread while the analysis request is in flight.
+    # The worker never touches Streamlit, so it needs no script context.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        ui_future = pool.submit(ui_verifier.verify_article, article.body)
+
+        with st.spinner("Analyzing with Claude..."):
+            try:
+                analysis = analyze_article(analyzer, article)
+            except Exception as e:
+                st.error(f"Analysis failed: {type(e).__name__}: {str(e)}")
+                return None
+
+        with st.spinner("Verifying UI..."):
+            try:
+                ui_report = ui_future.result()
+            except Exception:
+                ui_report = None
 
     report = generate_report(article, analysis, ui_report)
-    st.session_state.audit_history.append({
-        "title": report.article_title,
-        "score": report.overall_score,
-        "issues": report.total_issues,
-    })
+    record_audit(report)
     return report
 
 
+def _audit_one(url_or_id: str, client, analyzer, ui_verifier):
+    """Audit one article without touching Streamlit UI or session state.
+
+    Safe to run from worker threads; errors from fetching or analysis
+    propagate to the caller.
+    """
+    article = _fetch_article(client, client.subdomain, client.email, url_or_id)
+    analysis = analyze_article(analyzer, article)
+    try:
+        ui_report = ui_verifier.verify_article(article.body)
+    except Exception:
+        ui_report = None
+    return generate_report(article, analysis, ui_report)
+
+
+def _canonicalize(url_or_id: str) -> str:
+    """Reduce an article URL or ID to a key identifying what gets audited.
+
+    The key is the article ID plus the segment, since the segment decides
+    the declared audience. Host case, slugs and other query parameters
+    are ignored.
+    """
+    url_or_id = url_or_id.strip()
+    try:
+        article_id, segment = parse_article_ref(url_or_id)
+    except ValueError:
+        return url_or_id
+    # A bare ID has no segment, so it keys like a URL without one
+    return f"{article_id}:{segment or ''}"
+
+
+async def _audit_batch(articles: list[str], client, analyzer, ui_verifier,
+                       concurrency: int, on_done) -> tuple[list, list[str]]:
+    """Audit articles concurrently, with at most `concurrency` in flight.
+
+    Returns reports in input order (None where the audit failed) and a
+    list of failure messages. `on_done(done, total)` is called from the
+    event loop after each article completes.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(i: int, article: str):
+        async with semaphore:
+            try:
+                return i, await asyncio.to_thread(_audit_one, article, client, analyzer, ui_verifier), None
+            except Exception as e:
+                return i, None, f"{article}: {type(e).__name__}: {str(e)}"
+
+    reports = [None] * len(articles)
+    failures = []
+    tasks = [bounded(i, article) for i, article in enumerate(articles)]
+    for done, task in enumerate(asyncio.as_completed(tasks), start=1):
+        i, report, error = await task
+        reports[i] = report
+        if error:
+            failures.append(error)
+        on_done(done, len(articles))
+    return reports, failures
+
+
+def record_audit(report):
+    st.session_state.audit_history.append(AuditHistoryItem(
+        title=report.article_title,
+        score=report.overall_score,
+        issues=report.total_issues,
+        url=report.article_url,
+    ))
+
+
+@st.fragment
+def render_report(report):
+    """Render an audit report.
+
+    As a fragment, interactions inside the report (such as the download
+    buttons) rerun only this function with the same report, instead of
+    rerunning the tab and losing the audit result.
+    """
+    st.divider()
+    st.subheader(report.article_title)
+    st.caption(f"[View Article]({report.article_url})")
+    render_score_card(report)
+    st.divider()
+
+    findings_tabs = st.tabs(["📋 Summary", "✅ Actionable", "📝 Brief", "🎯 Targeted", "⚙️ Technical", "👥 Audience"])
+
+    with findings_tabs[0]:
+        if report.summary:
+            st.info(report.summary)
+        col1, col2 = st.columns(2)
+        with col1:
+            st.write(f"**Declared Audience:** {report.declared_audience}")
+            st.write(f"**Detected Audience:** {report.detected_audience}")
+            if report.audience_mismatch:
+                st.error("⚠️ Audience mismatch!")
+        with col2:
+            st.write(f"Web instructions: {'✅' if report.has_web_instructions else '❌'}")
+            st.write(f"App instructions: {'✅' if report.has_app_instructions else '❌'}")
+        if report.member_services_flag:
+            st.error(f"⚠️ Member Services Flag: {report.flag_reason}")
+        st.divider()
+        col1, col2 = st.columns(2)
+        with col1:
+            st.download_button("📄 Download Markdown", report.to_markdown(), file_name=f"audit_{report.article_id}.md")
+        with col2:
+            st.download_button("📊 Download JSON", report.to_json(), file_name=f"audit_{report.article_id}.json")
+
+    with findings_tabs[1]:
+        render_issues(report.actionable_issues, "Actionable")
+    with findings_tabs[2]:
+        render_issues(report.brief_issues, "Brief")
+    with findings_tabs[3]:
+        render_issues(report.targeted_issues, "Targeted")
+    with findings_tabs[4]:
+        render_issues(report.technical_issues, "Technical")
+        if report.hardcoded_links:
+            st.warning("**Hardcoded Links:**")
+            for link in report.hardcoded_links:
+                st.code(link)
+    with findings_tabs[5]:
+        render_issues(report.audience_issues, "Audience")
+
+
+@st.fragment
+def render_single_audit_tab(connected: bool):
+    """Single article audit tab."""
+    st.header("Audit a Single Article")
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        article_input = st.text_input("Article URL or ID", placeholder="https://help.etsy.com/hc/en-us/articles/123456789")
+    with col2:
+        st.write("")
+        st.write("")
+        audit_button = st.button("🔍 Audit", type="primary", disabled=not connected)
+
+    if audit_button and article_input:
+        report = audit_article(article_input)
+        if report:
+            render_report(report)
+
+
+@st.fragment
+def render_batch_audit_tab(connected: bool):
+    """Batch audit tab."""
+    st.header("Batch Audit")
+    batch_input = st.text_area("Article URLs/IDs (one per line)", height=150)
+    concurrency = st.slider(
+        "Parallel audits", min_value=1, max_value=8, value=6,
+        help="Lower this if Zendesk or Anthropic start rate limiting requests.",
+    )
+    if st.button("🔍 Audit All", type="primary", disabled=not connected):
+        if batch_input:
+            # Keep the first spelling of each article so duplicates are
+            # audited once
+            unique = {}
+            for line in batch_input.split("\n"):
+                if line.strip():
+                    unique.setdefault(_canonicalize(line), line.strip())
+            articles = list(unique.values())
+            client = st.session_state.zendesk_client
+            analyzer = st.session_state.analyzer
+            ui_verifier = get_ui_verifier()
+            progress = st.progress(0)
+            reports, failures = asyncio.run(_audit_batch(
+                articles, client, analyzer, ui_verifier,
+                concurrency=concurrency,
+                on_done=lambda done, total: progress.progress(done / total),
+            ))
+
+            # Session state is not thread-safe, so history is only
+            # updated here, after all workers have finished.
+            results = [r for r in reports if r]
+            for report in results:
+                record_audit(report)
+            if failures:
+                st.error("Some articles could not be audited:\n\n" + "\n".join(f"- {f}" for f in failures))
+            if results:
+                df = pd.DataFrame([{
+                    "Title": r.article_title[:40],
+                    "Score": r.overall_score,
+                    "Critical": len(r.critical_issues),
+                    "Warnings": len(r.warnings),
+                } for r in results])
+                st.dataframe(df, use_container_width=True)
+                all_reports = "\n\n---\n\n".join([r.to_markdown() for r in results])
+                st.download_button("📄 Download All", all_reports, file_name="batch_audit.md")
+
+
+@st.fragment
+def render_search_tab(connected: bool):
+    """Article search tab."""
+    st.header("Search Articles")
+    search_query = st.text_input("Search", placeholder="refund policy")
+    if st.button("🔍 Search", disabled=not connected):
+        if search_query:
+            with st.spinner("Searching..."):
+                try:
+                    results = st.session_state.zendesk_client.search_articles(search_query)
+                    if results:
+                        for article in results[:10]:
+                            with st.expander(article.title):
+                                st.write(f"ID: {article.id}")
+                                st.write(f"URL: {article.html_url}")
+                    else:
+                        st.info("No results.")
+                except Exception as e:
+                    st.error(f"Search failed: {str(e)}")
+
+
 def main():
     init_session_state()
+    # Read once per run and handed to the tabs; a new connection always
+    # triggers a full rerun, so fragment reruns never see a stale value.
+    connected = st.session_state.connected
 
     st.title("📝 Etsy Help Center Auditor")
     st.markdown("Audit help articles for quality and Etsy style guidelines.")
 
-    connect_services()
+    with st.sidebar:
+        connect_services()
 
     tab1, tab2, tab3 = st.tabs(["🔍 Single Audit", "📚 Batch Audit", "📊 Search"])
 
     with tab1:
-        st.header("Audit a Single Article")
-        col1, col2 = st.columns([3, 1])
-        with col1:
-            article_input = st.text_input("Article URL or ID", placeholder="https://help.etsy.com/hc/en-us/articles/123456789")
-        with col2:
-            st.write("")
-            st.write("")
-            audit_button = st.button("🔍 Audit", type="primary", disabled=not st.session_state.connected)
-
-        if audit_button and article_input:
-            report = audit_article(article_input)
-            if report:
-                st.divider()
-                st.subheader(report.article_title)
-                st.caption(f"[View Article]({report.article_url})")
-                render_score_card(report)
-                st.divider()
-
-                findings_tabs = st.tabs(["📋 Summary", "✅ Actionable", "📝 Brief", "🎯 Targeted", "⚙️ Technical", "👥 Audience"])
-
-                with findings_tabs[0]:
-                    if report.summary:
-                        st.info(report.summary)
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.write(f"**Declared Audience:** {report.declared_audience}")
-                        st.write(f"**Detected Audience:** {report.detected_audience}")
-                        if report.audience_mismatch:
-                            st.error("⚠️ Audience mismatch!")
-                    with col2:
-                        st.write(f"Web instructions: {'✅' if report.has_web_instructions else '❌'}")
-                        st.write(f"App instructions: {'✅' if report.has_app_instructions else '❌'}")
-                    if report.member_services_flag:
-                        st.error(f"⚠️ Member Services Flag: {report.flag_reason}")
-                    st.divider()
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.download_button("📄 Download Markdown", report.to_markdown(), file_name=f"audit_{report.article_id}.md")
-                    with col2:
-                        st.download_button("📊 Download JSON", report.to_json(), file_name=f"audit_{report.article_id}.json")
-
-                with findings_tabs[1]:
-                    render_issues(report.actionable_issues, "Actionable")
-                with findings_tabs[2]:
-                    render_issues(report.brief_issues, "Brief")
-                with findings_tabs[3]:
-                    render_issues(report.targeted_issues, "Targeted")
-                with findings_tabs[4]:
-                    render_issues(report.technical_issues, "Technical")
-                    if report.hardcoded_links:
-                        st.warning("**Hardcoded Links:**")
-                        for link in report.hardcoded_links:
-                            st.code(link)
-                with findings_tabs[5]:
-                    render_issues(report.audience_issues, "Audience")
-
+        render_single_audit_tab(connected)
     with tab2:
-        st.header("Batch Audit")
-        batch_input = st.text_area("Article URLs/IDs (one per line)", height=150)
-        if st.button("🔍 Audit All", type="primary", disabled=not st.session_state.connected):
-            if batch_input:
-                articles = [a.strip() for a in batch_input.split("\n") if a.strip()]
-                results = []
-                progress = st.progress(0)
-                for i, article in enumerate(articles):
-                    report = audit_article(article)
-                    if report:
-                        results.append(report)
-                    progress.progress((i + 1) / len(articles))
-                if results:
-                    import pandas as pd
-                    df = pd.DataFrame([{
-                        "Title": r.article_title[:40],
-                        "Score": r.overall_score,
-                        "Critical": len(r.critical_issues),
-                        "Warnings": len(r.warnings),
-                    } for r in results])
-                    st.dataframe(df, use_container_width=True)
-                    all_reports = "\n\n---\n\n".join([r.to_markdown() for r in results])
-                    st.download_button("📄 Download All", all_reports, file_name="batch_audit.md")
-
+        render_batch_audit_tab(connected)
     with tab3:
-        st.header("Search Articles")
-        search_query = st.text_input("Search", placeholder="refund policy")
-        if st.button("🔍 Search", disabled=not st.session_state.connected):
-            if search_query:
-                with st.spinner("Searching..."):
-                    try:
-                        results = st.session_state.zendesk_client.search_articles(search_query)
-                        if results:
-                            for article in results[:10]:
-                                with st.expander(article.title):
-                                    st.write(f"ID: {article.id}")
-                                    st.write(f"URL: {article.html_url}")
-                        else:
-                            st.info("No results.")
-                    except Exception as e:
-                        st.error(f"Search failed: {str(e)}")
+        render_search_tab(connected)
 
 
 if __name__ == "__main__":
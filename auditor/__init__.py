@@ -2,6 +2,7 @@ from .zendesk_client import ZendeskClient
 from .content_analyzer import ContentAnalyzer
 from .ui_verifier import UIVerifier
 from .report import AuditReport, generate_report
+from .cache import ResultCache
 
 __all__ = [
     "ZendeskClient",
@@ -9,4 +10,5 @@ __all__ = [
     "UIVerifier",
     "AuditReport",
     "generate_report",
+    "ResultCache",
 ]
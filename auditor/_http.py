@@ -0,0 +1,48 @@
+"""Shared HTTP client for the auditor's outbound requests."""
+
+import threading
+from typing import Optional
+import httpx
+
+
+# Settings shared by the sync and async clients. Zendesk article bodies
+# compress well, so ask for brotli as well as gzip.
+_CLIENT_OPTIONS = {
+    "http2": True,
+    "headers": {
+        "Accept-Encoding": "gzip, br",
+        "User-Agent": "HelpCenterAuditor/1.0",
+    },
+    "timeout": 30.0,
+    "follow_redirects": True,
+}
+
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> httpx.Client:
+    """
+    Return the process-wide pooled HTTP/2 client, creating it on first use.
+
+    Credentials are passed per request, so callers for different accounts
+    share one connection pool.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = httpx.Client(
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                **_CLIENT_OPTIONS,
+            )
+        return _client
+
+
+def new_async_client(**kwargs) -> httpx.AsyncClient:
+    """
+    Create an async client with the shared settings.
+
+    Async clients are tied to the event loop they run on, so each caller
+    creates and closes its own.
+    """
+    return httpx.AsyncClient(**_CLIENT_OPTIONS, **kwargs)
@@ -0,0 +1,81 @@
+"""Persistent cache for content analysis results."""
+
+import functools
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+import diskcache
+
+
+class ResultCache:
+    """On-disk cache of analysis results, shared across processes and restarts."""
+
+    def __init__(self, directory: str, ttl: Optional[float] = 7 * 86400, size_limit: int = int(1e9)):
+        """
+        Initialize the result cache.
+
+        Args:
+            directory: Directory for the cache database
+            ttl: Seconds before an entry expires (None to keep until evicted)
+            size_limit: Maximum cache size on disk, in bytes
+        """
+        self._cache = diskcache.Cache(directory, size_limit=size_limit)
+        self.ttl = ttl
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Build a cache key from the values that determine a result."""
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for `key`, or None on a miss."""
+        return self._cache.get(key)
+
+    def set(self, key: str, value: Any) -> None:
+        """Store `value` under `key` for `ttl` seconds."""
+        self._cache.set(key, value, expire=self.ttl)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._cache.clear()
+
+
+def digest_lru_cache(maxsize: int) -> Callable:
+    """
+    In-process LRU memo for a function of one string, keyed on its digest.
+
+    Like functools.lru_cache, but the cache holds a 16-byte blake2b digest
+    of the argument rather than the string itself, so memoizing a small
+    result doesn't keep a whole article body alive.
+
+    Args:
+        maxsize: Maximum number of results kept
+    """
+    def decorator(func: Callable[[str], Any]) -> Callable[[str], Any]:
+        entries: OrderedDict[bytes, Any] = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(text: str) -> Any:
+            key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+            with lock:
+                if key in entries:
+                    entries.move_to_end(key)
+                    return entries[key]
+
+            result = func(text)
+            with lock:
+                entries[key] = result
+                if len(entries) > maxsize:
+                    entries.popitem(last=False)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -1,11 +1,18 @@
 """Content analyzer using Claude API for article auditing."""
 
+import asyncio
+import hashlib
+import html
 import json
 import re
+import threading
+import time
 from dataclasses import dataclass, field
 from typing import Optional
-from anthropic import Anthropic
-from bs4 import BeautifulSoup
+from anthropic import Anthropic, APIError, AsyncAnthropic
+from selectolax.lexbor import LexborHTMLParser
+
+from .cache import ResultCache, digest_lru_cache
 
 
 @dataclass
@@ -33,13 +40,52 @@ class AnalysisResult:
     raw_analysis: Optional[str] = None
 
 
-AUDIT_PROMPT = """You are an expert Help Center content auditor for Etsy's support documentation (help.etsy.com). Analyze the following article against Etsy's content standards.
+# Hardcoded language tags in Etsy help URLs, e.g. /hc/en-us/
+_HARDCODED_LANG_RE = re.compile(r'/hc/[a-z]{2}-[a-z]{2}/')
+
+# Comments and script/style blocks, removed before the raw-HTML link scan
+# so anchors inside them are not reported
+_NON_MARKUP_RE = re.compile(r'<!--.*?-->|<(script|style)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+
+# href values of anchor tags: double-quoted, single-quoted or unquoted.
+# Earlier attributes are matched whole, so a '>' inside a quoted value
+# doesn't end the tag and data-href is not mistaken for href.
+_ANCHOR_HREF_RE = re.compile(
+    r"""<a(?:\s+(?!href\s*=)[^\s>"'=/]+(?:\s*=\s*(?:"[^"]*"|'[^']*'|[^\s>"']+))?)*"""
+    r"""\s+href\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>"']+))""",
+    re.IGNORECASE,
+)
+
+# Elements dropped before text extraction
+_NON_CONTENT_TAGS = ["script", "style", "nav", "footer", "aside"]
+
+# Article text budget sent to Claude, in tokens
+MAX_CONTENT_TOKENS = 4000
+
+# A token practically never averages under one character, so text up to
+# the budget in characters fits without a count_tokens call
+_UNCOUNTED_MAX_CHARS = MAX_CONTENT_TOKENS
+
+# Character limit used when tokens can't be counted (about four per token)
+_FALLBACK_MAX_CHARS = 4 * MAX_CONTENT_TOKENS
+
+# Content-defined chunking for corpus dedupe: a block ends after a line whose
+# hash is 0 mod this value, so blocks average about this many lines
+_DEDUPE_BOUNDARY_MODULUS = 32
+
+# Bump whenever the prompt or response parsing changes so cached results
+# from older versions are not reused.
+AUDIT_PROMPT_VERSION = "8"
+
+# Static audit instructions, sent as a cached system prompt so the same
+# prefix is reused across articles.
+AUDIT_FRAMEWORK = """You are an expert Help Center content auditor for Etsy's support documentation (help.etsy.com). Analyze the article you are given against Etsy's content standards.
 
 ## Audit Framework
 
 ### 1. Audience Detection & Mismatch
 - Identify if article is for: Buyer, Seller, or Both
-- Declared segment from URL: {declared_segment}
+- Compare with the declared audience given with the article (from its URL segment)
 - Flag mismatches (e.g., buyer article with seller-only terms like "Shop Manager", "listing", "order fulfillment")
 - Look for inappropriate cross-linking (buyer articles linking to seller tools or vice versa)
 
@@ -65,7 +111,14 @@ AUDIT_PROMPT = """You are an expert Help Center content auditor for Etsy's suppo
 - Check for outdated UI references
 - Verify internal links use relative paths where appropriate
 
-## Article to Analyze
+## Response Format
+
+Record your findings by calling the record_audit tool exactly once.
+
+Be thorough but practical. Focus on issues that genuinely impact user experience."""
+
+# Per-article part of the prompt
+AUDIT_ARTICLE_TEMPLATE = """## Article to Analyze
 
 **Title:** {title}
 **URL:** {url}
@@ -73,157 +126,374 @@ AUDIT_PROMPT = """You are an expert Help Center content auditor for Etsy's suppo
 **Declared Audience (from URL segment):** {declared_segment}
 
 **Content:**
-{content}
-
-## Response Format
-
-Respond with a JSON object containing:
-```json
-{{
-  "overall_score": <0-100>,
-  "audience_detected": "<Buyer|Seller|Both>",
-  "audience_mismatch": <true|false>,
-  "audience_mismatch_reason": "<explanation if mismatch>",
-  "has_web_instructions": <true|false>,
-  "has_app_instructions": <true|false>,
-  "issues": [
-    {{
-      "category": "<actionable|brief|targeted|technical|audience>",
-      "severity": "<critical|warning|suggestion>",
-      "description": "<what's wrong>",
-      "location": "<where in article, if specific>",
-      "recommendation": "<how to fix>"
-    }}
-  ],
-  "hardcoded_links": ["<list of links with hardcoded language tags>"],
-  "member_services_flag": <true|false>,
-  "flag_reason": "<why human verification needed, if flagged>",
-  "summary": "<2-3 sentence overall assessment>"
-}}
-```
-
-Be thorough but practical. Focus on issues that genuinely impact user experience."""
+{content}"""
+
+# Structured output: Claude is made to call this tool, so the analysis
+# arrives as already-parsed JSON instead of free text.
+AUDIT_TOOL = {
+    "name": "record_audit",
+    "description": "Record the audit findings for the article.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "overall_score": {"type": "integer", "minimum": 0, "maximum": 100},
+            "audience_detected": {"type": "string", "enum": ["Buyer", "Seller", "Both"]},
+            "audience_mismatch": {"type": "boolean"},
+            "audience_mismatch_reason": {"type": "string", "description": "Explanation if there is a mismatch"},
+            "has_web_instructions": {"type": "boolean"},
+            "has_app_instructions": {"type": "boolean"},
+            "issues": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "category": {
+                            "type": "string",
+                            "enum": ["actionable", "brief", "targeted", "technical", "audience"],
+                        },
+                        "severity": {"type": "string", "enum": ["critical", "warning", "suggestion"]},
+                        "description": {"type": "string", "description": "What's wrong"},
+                        "location": {"type": "string", "description": "Where in the article, if specific"},
+                        "recommendation": {"type": "string", "description": "How to fix it"},
+                    },
+                    "required": ["category", "severity", "description"],
+                },
+            },
+            "hardcoded_links": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Links with hardcoded language tags",
+            },
+            "member_services_flag": {"type": "boolean"},
+            "flag_reason": {"type": "string", "description": "Why human verification is needed, if flagged"},
+            "summary": {"type": "string", "description": "2-3 sentence overall assessment"},
+        },
+        "required": [
+            "overall_score",
+            "audience_detected",
+            "audience_mismatch",
+            "has_web_instructions",
+            "has_app_instructions",
+            "issues",
+            "member_services_flag",
+            "summary",
+        ],
+    },
+}
+
+
+@digest_lru_cache(maxsize=1024)
+def _scan_hardcoded_links(html_content: str) -> tuple[str, ...]:
+    """Scan raw HTML for help-center links with hardcoded language tags.
+
+    The result depends only on the HTML, so it is memoized on a digest of
+    it for re-audits within the process.
+    """
+    hardcoded = []
+
+    for match in _ANCHOR_HREF_RE.finditer(_NON_MARKUP_RE.sub("", html_content)):
+        quoted, single_quoted, unquoted = match.groups()
+        href = html.unescape(next(v for v in (quoted, single_quoted, unquoted) if v is not None))
+        if "help.etsy.com" in href or href.startswith("/hc/"):
+            if _HARDCODED_LANG_RE.search(href):
+                hardcoded.append(href)
+
+    return tuple(hardcoded)
 
 
 class ContentAnalyzer:
     """Analyzes article content using Claude API."""
 
-    def __init__(self, api_key: str, model: str = "claude-sonnet-4-20250514"):
+    def __init__(self, api_key: str, model: str = "claude-sonnet-4-20250514",
+                 dom_link_scan: bool = False, cache: Optional[ResultCache] = None,
+                 dedupe_corpus: bool = False):
         """
         Initialize the content analyzer.
 
         Args:
             api_key: Anthropic API key
             model: Claude model to use
+            dom_link_scan: Check for hardcoded links by walking the parsed
+                DOM instead of scanning the raw HTML with a regex
+            cache: Optional result cache; unchanged articles are served from
+                it instead of calling Claude again
+            dedupe_corpus: Replace text blocks already sent for an earlier
+                article (shared boilerplate) with a short reference. Changes
+                what Claude sees, so it is off by default.
         """
         self.client = Anthropic(api_key=api_key)
+        self.async_client = AsyncAnthropic(api_key=api_key)
         self.model = model
+        self.dom_link_scan = dom_link_scan
+        self.cache = cache
+        self.dedupe_corpus = dedupe_corpus
 
-    def _extract_text(self, html_content: str) -> str:
-        """Extract readable text from HTML content."""
-        soup = BeautifulSoup(html_content, "lxml")
+        # Corpus dedupe state: block digest -> id of the article it was first
+        # sent with, and the number of characters left out so far. The lock
+        # covers both, since batch audits build prompts from worker threads.
+        self._seen_blocks: dict[bytes, int] = {}
+        self.dedupe_chars_saved = 0
+        self._dedupe_lock = threading.Lock()
 
-        # Remove script and style elements
-        for element in soup(["script", "style"]):
-            element.decompose()
+    def _extract_text(self, tree: LexborHTMLParser) -> str:
+        """Extract readable text from parsed HTML content.
 
-        # Get text with some structure preserved
-        text = soup.get_text(separator="\n", strip=True)
+        Note: removes non-content elements from `tree` in place.
+        """
+        # Remove scripts, styles and page chrome that is noise for the audit
+        tree.strip_tags(_NON_CONTENT_TAGS)
 
-        # Clean up excessive whitespace
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        # Get text with some structure preserved
+        root = tree.body or tree.root
+        if root is None:
+            return ""
+        text = root.text(separator="\n", strip=True)
 
-        return text
+        # Whitespace-only text nodes come back as empty strings; drop the
+        # blank lines they leave so each block is one line
+        return "\n".join(line for line in text.split("\n") if line)
 
-    def _extract_links(self, html_content: str) -> list[dict]:
-        """Extract all links from HTML content."""
-        soup = BeautifulSoup(html_content, "lxml")
+    def _extract_links(self, tree: LexborHTMLParser) -> list[dict]:
+        """Extract all links from parsed HTML content."""
         links = []
 
-        for a in soup.find_all("a", href=True):
+        for a in tree.css("a[href]"):
             links.append({
-                "text": a.get_text(strip=True),
-                "href": a["href"]
+                "text": a.text(strip=True),
+                "href": a.attributes.get("href") or ""
             })
 
         return links
 
     def _check_hardcoded_links(self, html_content: str) -> list[str]:
-        """Find links with hardcoded language tags."""
-        soup = BeautifulSoup(html_content, "lxml")
-        hardcoded = []
+        """Find links with hardcoded language tags by scanning the raw HTML."""
+        return list(_scan_hardcoded_links(html_content))
 
-        # Pattern for hardcoded language tags in Etsy help URLs
-        pattern = re.compile(r'/hc/[a-z]{2}-[a-z]{2}/')
+    def _check_hardcoded_links_dom(self, tree: LexborHTMLParser) -> list[str]:
+        """Find links with hardcoded language tags in parsed HTML content."""
+        hardcoded = []
 
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
+        for a in tree.css("a[href]"):
+            href = a.attributes.get("href") or ""
             if "help.etsy.com" in href or href.startswith("/hc/"):
-                if pattern.search(href):
+                if _HARDCODED_LANG_RE.search(href):
                     hardcoded.append(href)
 
         return hardcoded
 
-    def analyze(self, article) -> AnalysisResult:
-        """
-        Analyze an article for content quality issues.
-
-        Args:
-            article: Article object from ZendeskClient
+    def _trim_content(self, text: str) -> str:
+        """Trim text to the content token budget at a line or sentence boundary."""
+        if len(text) <= _UNCOUNTED_MAX_CHARS:
+            return text
 
-        Returns:
-            AnalysisResult with findings
-        """
-        # Extract text for analysis
-        text_content = self._extract_text(article.body)
+        try:
+            tokens = self.client.messages.count_tokens(
+                model=self.model,
+                messages=[{"role": "user", "content": text}],
+            ).input_tokens
+        except APIError:
+            # No count available; fall back to the character limit
+            return self._trim_to_chars(text, _FALLBACK_MAX_CHARS)
+
+        if tokens <= MAX_CONTENT_TOKENS:
+            return text
+        # Scale the cut by the text's own characters-per-token ratio
+        return self._trim_to_chars(text, len(text) * MAX_CONTENT_TOKENS // tokens)
+
+    def _trim_to_chars(self, text: str, max_chars: int) -> str:
+        """Trim text to at most max_chars characters at a line or sentence boundary."""
+        cut = text[:max_chars]
+        # Prefer ending on a whole block, then a whole sentence, as long
+        # as that doesn't throw away more than half the budget
+        for boundary in ("\n", ". "):
+            end = cut.rfind(boundary)
+            if end >= max_chars // 2:
+                return cut[:end + 1].rstrip()
+        return cut
+
+    def _dedupe_blocks(self, text: str, article_id: int) -> str:
+        """Replace blocks already sent with an earlier article by a reference."""
+        out = []
+        block = []
+
+        def flush():
+            block_text = "\n".join(block)
+            block.clear()
+            digest = hashlib.blake2b(block_text.encode(), digest_size=16).digest()
+            with self._dedupe_lock:
+                first_id = self._seen_blocks.setdefault(digest, article_id)
+                reference = f"[see article {first_id}]"
+                if first_id != article_id and len(block_text) > len(reference):
+                    self.dedupe_chars_saved += len(block_text) - len(reference)
+                    out.append(reference)
+                else:
+                    out.append(block_text)
+
+        for line in text.split("\n"):
+            block.append(line)
+            # Boundaries depend only on line content, so shared runs of lines
+            # chunk the same way in every article. Blank lines never end a block.
+            if line and hashlib.blake2b(line.encode(), digest_size=8).digest()[0] % _DEDUPE_BOUNDARY_MODULUS == 0:
+                flush()
+        if block:
+            flush()
+
+        return "\n".join(out)
+
+    def _build_prompt(self, article) -> tuple[str, list[str]]:
+        """Build the audit prompt and pre-check hardcoded links."""
+        # Parse once and share the tree between the helpers
+        tree = LexborHTMLParser(article.body)
 
         # Pre-check hardcoded links
-        hardcoded_links = self._check_hardcoded_links(article.body)
+        if self.dom_link_scan:
+            hardcoded_links = self._check_hardcoded_links_dom(tree)
+        else:
+            hardcoded_links = self._check_hardcoded_links(article.body)
+
+        # Extract text for analysis (strips non-content tags from the tree)
+        text_content = self._extract_text(tree)
+        if self.dedupe_corpus:
+            text_content = self._dedupe_blocks(text_content, article.id)
 
         # Build the prompt
-        prompt = AUDIT_PROMPT.format(
+        prompt = AUDIT_ARTICLE_TEMPLATE.format(
             title=article.title,
             url=article.html_url,
             section=article.section_name or "Unknown",
             declared_segment=article.audience,
-            content=text_content[:15000]  # Limit content length
+            content=self._trim_content(text_content)
         )
 
-        # Call Claude
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=4096,
-            messages=[
+        return prompt, hardcoded_links
+
+    def _request_params(self, prompt: str) -> dict:
+        """Build the Messages API parameters for an audit prompt."""
+        return {
+            "model": self.model,
+            "max_tokens": 4096,
+            "system": [
+                {"type": "text", "text": AUDIT_FRAMEWORK, "cache_control": {"type": "ephemeral"}}
+            ],
+            "tools": [AUDIT_TOOL],
+            "tool_choice": {"type": "tool", "name": AUDIT_TOOL["name"]},
+            "messages": [
                 {"role": "user", "content": prompt}
-            ]
-        )
+            ],
+        }
 
-        # Parse response
-        response_text = response.content[0].text
+    def _error_result(self, description: str, raw_analysis: Optional[str] = None) -> AnalysisResult:
+        """Build a placeholder result for an analysis that did not complete."""
+        return AnalysisResult(
+            overall_score=0,
+            audience_detected="Unknown",
+            audience_mismatch=False,
+            issues=[Issue(
+                category="technical",
+                severity="critical",
+                description=description,
+                recommendation="Please try again"
+            )],
+            raw_analysis=raw_analysis
+        )
 
-        # Extract JSON from response
+    def _response_text(self, message) -> str:
+        """Concatenate the text blocks of a Claude response."""
+        return "".join(block.text for block in message.content if block.type == "text")
+
+    def _parse_analysis(self, message) -> Optional[dict]:
+        """Extract the analysis from Claude's response, or None if there is none."""
+        # A response cut off at max_tokens can hold a partial tool input or
+        # partial JSON text; never treat that as a complete analysis
+        if message.stop_reason == "max_tokens":
+            return None
+
+        # Normal path: the forced record_audit tool call carries parsed JSON.
+        # Only a finished call counts.
+        for block in message.content:
+            if block.type == "tool_use" and block.name == AUDIT_TOOL["name"]:
+                if message.stop_reason != "tool_use":
+                    return None
+                return self._complete_analysis(block.input)
+
+        # Fallback: JSON in plain text, possibly inside a ```json fence
+        text = self._response_text(message)
+        start, end = text.find("{"), text.rfind("}")
+        if start == -1 or end < start:
+            return None
         try:
-            # Try to find JSON in the response
-            json_match = re.search(r'\{[\s\S]*\}', response_text)
-            if json_match:
-                analysis = json.loads(json_match.group())
-            else:
-                raise ValueError("No JSON found in response")
-        except (json.JSONDecodeError, ValueError):
-            # Return a basic result if parsing fails
-            return AnalysisResult(
-                overall_score=0,
-                audience_detected="Unknown",
-                audience_mismatch=False,
-                issues=[Issue(
-                    category="technical",
-                    severity="critical",
-                    description="Failed to parse analysis response",
-                    recommendation="Please try again"
-                )],
-                raw_analysis=response_text
-            )
+            analysis = json.loads(text[start:end + 1])
+        except json.JSONDecodeError:
+            return None
+        return self._complete_analysis(analysis)
+
+    def _complete_analysis(self, analysis) -> Optional[dict]:
+        """Return the analysis if it is a dict with every required field, else None."""
+        if not isinstance(analysis, dict):
+            return None
+        if any(key not in analysis for key in AUDIT_TOOL["input_schema"]["required"]):
+            return None
+        return analysis
+
+    def _cache_key(self, article, prompt: Optional[str] = None) -> str:
+        """Key identifying everything that goes into an article's analysis.
+
+        With corpus dedupe on, the prompt depends on which articles this
+        analyzer saw first, so the built prompt is part of the key.
+        """
+        return ResultCache.make_key(
+            article.body,
+            article.title,
+            article.html_url,
+            article.section_name or "",
+            article.audience,
+            self.model,
+            AUDIT_PROMPT_VERSION,
+            prompt if self.dedupe_corpus else "",
+        )
+
+    def _cached_result(self, article, prompt: Optional[str] = None
+                       ) -> tuple[Optional[str], Optional[AnalysisResult]]:
+        """Look up an article in the result cache.
+
+        `prompt` is the built prompt, required when corpus dedupe is on.
+        Returns the cache key (None when caching is off) and the cached
+        result (None on a miss).
+        """
+        if self.cache is None:
+            return None, None
+        key = self._cache_key(article, prompt)
+        return key, self.cache.get(key)
+
+    def _prepare(self, article) -> tuple[Optional[str], Optional[AnalysisResult], Optional[tuple[str, list[str]]]]:
+        """Look up an article in the result cache, building its prompt on a miss.
 
+        Returns the cache key, the cached result (None on a miss) and the
+        built prompt with its hardcoded links (None on a hit). With corpus
+        dedupe on, the prompt is built first because it is part of the key.
+        """
+        prepared = self._build_prompt(article) if self.dedupe_corpus else None
+        cache_key, cached = self._cached_result(article, prepared[0] if prepared else None)
+        if cached is not None:
+            return cache_key, cached, None
+        return cache_key, None, prepared or self._build_prompt(article)
+
+    def _result_from_response(self, message, hardcoded_links: list[str],
+                              cache_key: Optional[str] = None) -> AnalysisResult:
+        """Turn Claude's response into an AnalysisResult, caching it if it parsed."""
+        analysis = self._parse_analysis(message)
+        if analysis is None:
+            # Return a basic result if parsing fails. It is not cached, so
+            # a retry gets a fresh attempt.
+            return self._error_result("Failed to parse analysis response", self._response_text(message))
+
+        result = self._build_result(analysis, hardcoded_links)
+        if cache_key is not None:
+            self.cache.set(cache_key, result)
+        return result
+
+    def _build_result(self, analysis: dict, hardcoded_links: list[str]) -> AnalysisResult:
+        """Build an AnalysisResult from Claude's parsed JSON analysis."""
         # Build result
         issues = []
         for issue_data in analysis.get("issues", []):
@@ -236,7 +506,8 @@ class ContentAnalyzer:
             ))
 
         # Add hardcoded link issues if found (from our pre-check)
-        all_hardcoded = list(set(hardcoded_links + analysis.get("hardcoded_links", [])))
+        # dict.fromkeys dedupes while keeping first-seen order, so reports are stable
+        all_hardcoded = list(dict.fromkeys((*hardcoded_links, *analysis.get("hardcoded_links", ()))))
         if all_hardcoded:
             issues.append(Issue(
                 category="technical",
@@ -257,3 +528,120 @@ class ContentAnalyzer:
             flag_reason=analysis.get("flag_reason"),
             raw_analysis=analysis.get("summary")
         )
+
+    def analyze(self, article) -> AnalysisResult:
+        """
+        Analyze an article for content quality issues.
+
+        Args:
+            article: Article object from ZendeskClient
+
+        Returns:
+            AnalysisResult with findings
+        """
+        cache_key, cached, prepared = self._prepare(article)
+        if cached is not None:
+            return cached
+
+        prompt, hardcoded_links = prepared
+
+        # Call Claude
+        response = self.client.messages.create(**self._request_params(prompt))
+
+        return self._result_from_response(response, hardcoded_links, cache_key)
+
+    async def analyze_async(self, article) -> AnalysisResult:
+        """
+        Analyze an article without blocking the event loop.
+
+        Same as analyze(), but awaits the Claude call so many articles can
+        be in flight at once.
+
+        Args:
+            article: Article object from ZendeskClient
+
+        Returns:
+            AnalysisResult with findings
+        """
+        # Building the prompt can make a blocking count_tokens call for a
+        # long article, so keep it off the event loop
+        cache_key, cached, prepared = await asyncio.to_thread(self._prepare, article)
+        if cached is not None:
+            return cached
+
+        prompt, hardcoded_links = prepared
+
+        response = await self.async_client.messages.create(**self._request_params(prompt))
+
+        return self._result_from_response(response, hardcoded_links, cache_key)
+
+    async def analyze_many(self, articles: list, concurrency: int = 10) -> list[AnalysisResult]:
+        """
+        Analyze several articles concurrently.
+
+        Args:
+            articles: Article objects from ZendeskClient
+            concurrency: Maximum number of Claude requests in flight at once
+
+        Returns:
+            AnalysisResult for each article, in the same order as `articles`
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded(article) -> AnalysisResult:
+            async with semaphore:
+                return await self.analyze_async(article)
+
+        return await asyncio.gather(*(bounded(article) for article in articles))
+
+    def analyze_batch(self, articles: list, poll_interval: float = 30.0) -> list[AnalysisResult]:
+        """
+        Analyze many articles through the Message Batches API.
+
+        Batched requests cost half as much as individual calls but can take
+        minutes (up to 24 hours) to complete, so this suits bulk audits
+        that nobody is waiting on interactively.
+
+        Args:
+            articles: Article objects from ZendeskClient
+            poll_interval: Seconds to wait between batch status checks
+
+        Returns:
+            AnalysisResult for each article, in the same order as `articles`
+        """
+        if not articles:
+            return []
+
+        results: list[Optional[AnalysisResult]] = [None] * len(articles)
+        cache_keys: list[Optional[str]] = [None] * len(articles)
+        prepared = {}
+        for i, article in enumerate(articles):
+            cache_keys[i], results[i], article_prepared = self._prepare(article)
+            if results[i] is None:
+                prepared[i] = article_prepared
+
+        if prepared:
+            # custom_id is the article's position, since the same article
+            # may appear more than once
+            batch = self.client.messages.batches.create(requests=[
+                {"custom_id": str(i), "params": self._request_params(prompt)}
+                for i, (prompt, _) in prepared.items()
+            ])
+
+            while batch.processing_status != "ended":
+                time.sleep(poll_interval)
+                batch = self.client.messages.batches.retrieve(batch.id)
+
+            for entry in self.client.messages.batches.results(batch.id):
+                i = int(entry.custom_id)
+                if entry.result.type == "succeeded":
+                    results[i] = self._result_from_response(
+                        entry.result.message, prepared[i][1], cache_keys[i]
+                    )
+                else:
+                    results[i] = self._error_result(f"Batch request {entry.result.type}")
+
+        return [
+            result if result is not None else self._error_result("Batch request missing from results")
+            for result in results
+        ]
@@ -10,6 +10,19 @@ from .ui_verifier import UIVerificationReport
 from .zendesk_client import Article
 
 
+_SEVERITY_ICON = {"critical": "🔴", "warning": "🟡", "suggestion": "🔵"}
+
+# Issue categories, in report order
+_CATEGORIES = ("actionable", "brief", "targeted", "technical", "audience")
+
+# Markdown headings for the per-category issue sections
+_HEADING_ACTIONABLE = "### Actionable Issues"
+_HEADING_BRIEF = "### Brief Issues"
+_HEADING_TARGETED = "### Targeted Issues"
+_HEADING_TECHNICAL = "### Technical Issues"
+_HEADING_AUDIENCE = "### Audience Issues"
+
+
 @dataclass
 class AuditReport:
     """Complete audit report for a Help Center article."""
@@ -31,12 +44,8 @@ class AuditReport:
     has_web_instructions: bool
     has_app_instructions: bool
 
-    # Issues by category
-    actionable_issues: list[Issue] = field(default_factory=list)
-    brief_issues: list[Issue] = field(default_factory=list)
-    targeted_issues: list[Issue] = field(default_factory=list)
-    technical_issues: list[Issue] = field(default_factory=list)
-    audience_issues: list[Issue] = field(default_factory=list)
+    # All issues; per-category and per-severity views are built in __post_init__
+    issues: list[Issue] = field(default_factory=list)
 
     # Technical details
     hardcoded_links: list[str] = field(default_factory=list)
@@ -54,48 +63,58 @@ class AuditReport:
     # Summary
     summary: Optional[str] = None
 
+    # Views over `issues`, keyed by category and by severity
+    _by_category: dict[str, list[Issue]] = field(init=False, repr=False)
+    _by_severity: dict[str, list[Issue]] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Bucket by category in a single pass; unknown categories count as technical
+        self._by_category = {category: [] for category in _CATEGORIES}
+        for issue in self.issues:
+            self._by_category.get(issue.category, self._by_category["technical"]).append(issue)
+
+        # Severity lists follow category order, matching the report layout
+        self._by_severity = {"critical": [], "warning": [], "suggestion": []}
+        for bucket in self._by_category.values():
+            for issue in bucket:
+                if issue.severity in self._by_severity:
+                    self._by_severity[issue.severity].append(issue)
+
+    @property
+    def actionable_issues(self) -> list[Issue]:
+        return self._by_category["actionable"]
+
+    @property
+    def brief_issues(self) -> list[Issue]:
+        return self._by_category["brief"]
+
+    @property
+    def targeted_issues(self) -> list[Issue]:
+        return self._by_category["targeted"]
+
+    @property
+    def technical_issues(self) -> list[Issue]:
+        return self._by_category["technical"]
+
+    @property
+    def audience_issues(self) -> list[Issue]:
+        return self._by_category["audience"]
+
     @property
     def total_issues(self) -> int:
-        return (
-            len(self.actionable_issues) +
-            len(self.brief_issues) +
-            len(self.targeted_issues) +
-            len(self.technical_issues) +
-            len(self.audience_issues)
-        )
+        return len(self.issues)
 
     @property
     def critical_issues(self) -> list[Issue]:
-        all_issues = (
-            self.actionable_issues +
-            self.brief_issues +
-            self.targeted_issues +
-            self.technical_issues +
-            self.audience_issues
-        )
-        return [i for i in all_issues if i.severity == "critical"]
+        return self._by_severity["critical"]
 
     @property
     def warnings(self) -> list[Issue]:
-        all_issues = (
-            self.actionable_issues +
-            self.brief_issues +
-            self.targeted_issues +
-            self.technical_issues +
-            self.audience_issues
-        )
-        return [i for i in all_issues if i.severity == "warning"]
+        return self._by_severity["warning"]
 
     @property
     def suggestions(self) -> list[Issue]:
-        all_issues = (
-            self.actionable_issues +
-            self.brief_issues +
-            self.targeted_issues +
-            self.technical_issues +
-            self.audience_issues
-        )
-        return [i for i in all_issues if i.severity == "suggestion"]
+        return self._by_severity["suggestion"]
 
     def to_dict(self) -> dict:
         """Convert report to dictionary for serialization."""
@@ -140,114 +159,84 @@ class AuditReport:
 
     def to_markdown(self) -> str:
         """Convert report to Markdown format."""
-        lines = []
-
-        # Header
-        lines.append(f"# Audit Report: {self.article_title}")
-        lines.append("")
-        lines.append(f"**Article ID:** {self.article_id}")
-        lines.append(f"**URL:** {self.article_url}")
-        lines.append(f"**Audit Date:** {self.audit_timestamp}")
-        lines.append("")
-
-        # Overall assessment
-        lines.append("## Overall Assessment")
-        lines.append("")
         score_emoji = "🟢" if self.overall_score >= 80 else "🟡" if self.overall_score >= 60 else "🔴"
-        lines.append(f"**Score:** {score_emoji} {self.overall_score}/100 ({self.quality_rating})")
-        lines.append("")
-
-        if self.summary:
-            lines.append(f"_{self.summary}_")
-            lines.append("")
-
-        # Audience
-        lines.append("## Audience")
-        lines.append("")
         mismatch_indicator = "⚠️ MISMATCH" if self.audience_mismatch else "✓"
-        lines.append(f"- **Declared:** {self.declared_audience}")
-        lines.append(f"- **Detected:** {self.detected_audience} {mismatch_indicator}")
-        lines.append("")
-
-        # Content completeness
-        lines.append("## Content Completeness")
-        lines.append("")
         web_check = "✓" if self.has_web_instructions else "✗"
         app_check = "✓" if self.has_app_instructions else "✗"
-        lines.append(f"- Web instructions: {web_check}")
-        lines.append(f"- App instructions: {app_check}")
-        lines.append("")
-
-        # Issues summary
-        lines.append("## Issues Summary")
-        lines.append("")
-        lines.append(f"- 🔴 Critical: {len(self.critical_issues)}")
-        lines.append(f"- 🟡 Warnings: {len(self.warnings)}")
-        lines.append(f"- 🔵 Suggestions: {len(self.suggestions)}")
-        lines.append("")
 
-        # Detailed issues by category
-        if self.actionable_issues:
-            lines.append("### Actionable Issues")
-            lines.append("")
-            for issue in self.actionable_issues:
-                lines.append(_format_issue_md(issue))
-            lines.append("")
-
-        if self.brief_issues:
-            lines.append("### Brief Issues")
-            lines.append("")
-            for issue in self.brief_issues:
-                lines.append(_format_issue_md(issue))
-            lines.append("")
+        # Header, overall assessment
+        lines = [
+            f"# Audit Report: {self.article_title}",
+            "",
+            f"**Article ID:** {self.article_id}",
+            f"**URL:** {self.article_url}",
+            f"**Audit Date:** {self.audit_timestamp}",
+            "",
+            "## Overall Assessment",
+            "",
+            f"**Score:** {score_emoji} {self.overall_score}/100 ({self.quality_rating})",
+            "",
+        ]
 
-        if self.targeted_issues:
-            lines.append("### Targeted Issues")
-            lines.append("")
-            for issue in self.targeted_issues:
-                lines.append(_format_issue_md(issue))
-            lines.append("")
-
-        if self.technical_issues:
-            lines.append("### Technical Issues")
-            lines.append("")
-            for issue in self.technical_issues:
-                lines.append(_format_issue_md(issue))
-            lines.append("")
+        if self.summary:
+            lines.extend((f"_{self.summary}_", ""))
+
+        # Audience, content completeness, issues summary
+        lines.extend((
+            "## Audience",
+            "",
+            f"- **Declared:** {self.declared_audience}",
+            f"- **Detected:** {self.detected_audience} {mismatch_indicator}",
+            "",
+            "## Content Completeness",
+            "",
+            f"- Web instructions: {web_check}",
+            f"- App instructions: {app_check}",
+            "",
+            "## Issues Summary",
+            "",
+            f"- 🔴 Critical: {len(self.critical_issues)}",
+            f"- 🟡 Warnings: {len(self.warnings)}",
+            f"- 🔵 Suggestions: {len(self.suggestions)}",
+            "",
+        ))
 
-        if self.audience_issues:
-            lines.append("### Audience Issues")
-            lines.append("")
-            for issue in self.audience_issues:
-                lines.append(_format_issue_md(issue))
-            lines.append("")
+        # Detailed issues by category
+        for heading, issues in (
+            (_HEADING_ACTIONABLE, self.actionable_issues),
+            (_HEADING_BRIEF, self.brief_issues),
+            (_HEADING_TARGETED, self.targeted_issues),
+            (_HEADING_TECHNICAL, self.technical_issues),
+            (_HEADING_AUDIENCE, self.audience_issues),
+        ):
+            if issues:
+                lines.extend((heading, ""))
+                lines.extend(_format_issue_md(issue) for issue in issues)
+                lines.append("")
 
         # Hardcoded links
         if self.hardcoded_links:
-            lines.append("## Hardcoded Links (Need Dynamic Localization)")
-            lines.append("")
-            for link in self.hardcoded_links:
-                lines.append(f"- `{link}`")
+            lines.extend(("## Hardcoded Links (Need Dynamic Localization)", ""))
+            lines.extend(f"- `{link}`" for link in self.hardcoded_links)
             lines.append("")
 
         # UI Verification
         if self.ui_elements_total > 0:
-            lines.append("## UI Verification")
-            lines.append("")
-            lines.append(f"- Elements found: {self.ui_elements_total}")
-            lines.append(f"- Confidence: {self.ui_confidence:.0%}")
-            lines.append("")
+            lines.extend((
+                "## UI Verification",
+                "",
+                f"- Elements found: {self.ui_elements_total}",
+                f"- Confidence: {self.ui_confidence:.0%}",
+                "",
+            ))
             if self.ui_manual_review_items:
                 lines.append("**Items requiring manual review:**")
-                for item in self.ui_manual_review_items:
-                    lines.append(f"- {item}")
+                lines.extend(f"- {item}" for item in self.ui_manual_review_items)
                 lines.append("")
 
         # Member Services Flag
         if self.member_services_flag:
-            lines.append("## ⚠️ Member Services Flag")
-            lines.append("")
-            lines.append("**This article requires human verification.**")
+            lines.extend(("## ⚠️ Member Services Flag", "", "**This article requires human verification.**"))
             if self.flag_reason:
                 lines.append(f"Reason: {self.flag_reason}")
             lines.append("")
@@ -267,7 +256,7 @@ def _issue_to_dict(issue: Issue) -> dict:
 
 def _format_issue_md(issue: Issue) -> str:
     """Format a single issue for Markdown output."""
-    severity_icon = {"critical": "🔴", "warning": "🟡", "suggestion": "🔵"}.get(issue.severity, "⚪")
+    severity_icon = _SEVERITY_ICON.get(issue.severity, "⚪")
     lines = [f"- {severity_icon} **{issue.description}**"]
     if issue.location:
         lines.append(f"  - Location: {issue.location}")
@@ -304,13 +293,6 @@ def generate_report(
     Returns:
         Complete AuditReport
     """
-    # Categorize issues
-    actionable_issues = [i for i in analysis.issues if i.category == "actionable"]
-    brief_issues = [i for i in analysis.issues if i.category == "brief"]
-    targeted_issues = [i for i in analysis.issues if i.category == "targeted"]
-    technical_issues = [i for i in analysis.issues if i.category == "technical"]
-    audience_issues = [i for i in analysis.issues if i.category == "audience"]
-
     # UI verification stats
     ui_elements_verified = 0
     ui_elements_total = 0
@@ -335,11 +317,7 @@ def generate_report(
         audience_mismatch=analysis.audience_mismatch,
         has_web_instructions=analysis.has_web_instructions,
         has_app_instructions=analysis.has_app_instructions,
-        actionable_issues=actionable_issues,
-        brief_issues=brief_issues,
-        targeted_issues=targeted_issues,
-        technical_issues=technical_issues,
-        audience_issues=audience_issues,
+        issues=analysis.issues,
         hardcoded_links=analysis.hardcoded_links,
         ui_elements_verified=ui_elements_verified,
         ui_elements_total=ui_elements_total,
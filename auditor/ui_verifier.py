@@ -1,22 +1,43 @@
 """Live UI verification for Etsy platform."""
 
 import re
+from collections.abc import Iterator
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
-import requests
-from bs4 import BeautifulSoup
+import ahocorasick
+from lxml import etree
+from lxml import html as lxml_html
 
+from .cache import digest_lru_cache
 
-@dataclass
+try:
+    # google-re2 matches in linear time without backtracking; same API as re
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
+
+@dataclass(slots=True, frozen=True)
 class UIElement:
     """Represents a UI element or navigation path mentioned in an article."""
     text: str
     element_type: str  # 'button', 'navigation', 'menu', 'link', 'tab'
-    context: str  # Surrounding text for context
     platform: str  # 'web', 'app', 'both', 'unknown'
 
+    # Surrounding text for context, kept as offsets into the article text
+    # (shared by every element) and sliced only when asked for
+    _text: str = field(repr=False)
+    _ctx_start: int
+    _ctx_end: int
+
+    @property
+    def context(self) -> str:
+        """Surrounding text for context."""
+        return self._text[self._ctx_start:self._ctx_end]
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VerificationResult:
     """Result of UI verification."""
     element: UIElement
@@ -26,7 +47,7 @@ class VerificationResult:
     source: Optional[str] = None  # Where we verified this
 
 
-@dataclass
+@dataclass(slots=True)
 class UIVerificationReport:
     """Complete UI verification report for an article."""
     elements_found: list[UIElement] = field(default_factory=list)
@@ -72,7 +93,7 @@ KNOWN_UI_ELEMENTS = {
     "hamburger menu": {"status": "current", "platform": "app", "type": "menu"},
 }
 
-# Patterns that often indicate outdated UI
+# Phrases that often indicate outdated UI (matched as plain substrings)
 OUTDATED_PATTERNS = [
     r"click the gear icon",  # Replaced with different settings access
     r"go to your shop",  # Now "Shop Manager"
@@ -80,114 +101,251 @@ OUTDATED_PATTERNS = [
     r"alchemy",  # Old search feature
 ]
 
+# Hot-path form of KNOWN_UI_ELEMENTS: lowercased name -> (status, platform, type)
+_KNOWN = {
+    name.lower(): (info["status"], info["platform"], info["type"])
+    for name, info in KNOWN_UI_ELEMENTS.items()
+}
 
-class UIVerifier:
-    """Verifies UI elements mentioned in articles against live Etsy site."""
+# Known element names in priority order for partial matches
+_KNOWN_KEYS = list(_KNOWN)
 
-    def __init__(self):
-        """Initialize the UI verifier."""
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "Mozilla/5.0 (compatible; HelpCenterAuditor/1.0)"
-        })
 
-    def _extract_ui_elements(self, html_content: str) -> list[UIElement]:
-        """Extract UI elements and navigation paths from article content."""
-        soup = BeautifulSoup(html_content, "lxml")
-        text = soup.get_text(separator=" ", strip=True)
+def _build_phrase_automaton() -> ahocorasick.Automaton:
+    """Build one Aho-Corasick automaton over outdated phrases and known element names.
 
-        elements = []
+    Each phrase maps to a tuple of (kind, index) hits, since the same phrase
+    could appear in both lists.
+    """
+    hits: dict[str, list[tuple[str, int]]] = {}
+    for index, phrase in enumerate(OUTDATED_PATTERNS):
+        hits.setdefault(phrase, []).append(("outdated", index))
+    for index, known in enumerate(_KNOWN_KEYS):
+        hits.setdefault(known, []).append(("known", index))
 
-        # Pattern for navigation paths: "Go to X > Y > Z" or "Select X > Y"
-        nav_patterns = [
-            r'(?:go to|navigate to|select|click|tap|open)\s+([A-Z][^.!?\n]{5,50}(?:\s*>\s*[A-Z][^.!?\n>]{2,30})*)',
-            r'(?:from|in|under)\s+(?:the\s+)?([A-Z][^.!?\n]{3,30}(?:\s*>\s*[A-Z][^.!?\n>]{2,30})+)',
-        ]
+    automaton = ahocorasick.Automaton()
+    for phrase, phrase_hits in hits.items():
+        automaton.add_word(phrase, tuple(phrase_hits))
+    automaton.make_automaton()
+    return automaton
+
+
+_PHRASE_AUTOMATON = _build_phrase_automaton()
+
+
+def _build_known_substrings() -> dict[str, int]:
+    """Map every substring of every known element name to the lowest index of a name containing it."""
+    substrings: dict[str, int] = {}
+    for index, known in enumerate(_KNOWN_KEYS):
+        for start in range(len(known) + 1):
+            for end in range(start, len(known) + 1):
+                substrings.setdefault(known[start:end], index)
+    return substrings
 
-        for pattern in nav_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                path = match.group(1).strip()
-                # Get surrounding context
-                start = max(0, match.start() - 50)
-                end = min(len(text), match.end() + 50)
-                context = text[start:end]
 
-                # Determine platform
-                platform = "unknown"
-                context_lower = context.lower()
-                if "app" in context_lower or "mobile" in context_lower:
-                    platform = "app"
-                elif "website" in context_lower or "browser" in context_lower or "etsy.com" in context_lower:
-                    platform = "web"
+# Reverse containment index: answers "is the text inside a known name?"
+# with one dict lookup instead of a scan over every name
+_KNOWN_SUBSTRINGS = _build_known_substrings()
+
+# Navigation paths: "Go to X > Y > Z" or "Select X > Y". Kept as separate
+# patterns: a fused alternation would return only non-overlapping matches,
+# and the action pattern usually swallows a following "in X > Y" path.
+_NAV_PATTERNS = [
+    _regex.compile(r'(?i)(?:go to|navigate to|select|click|tap|open)[\s\xa0]+([A-Z][^.!?\n]{5,50}(?:[\s\xa0]*>[\s\xa0]*[A-Z][^.!?\n>]{2,30})*)'),
+    _regex.compile(r'(?i)(?:from|in|under)[\s\xa0]+(?:the[\s\xa0]+)?([A-Z][^.!?\n]{3,30}(?:[\s\xa0]*>[\s\xa0]*[A-Z][^.!?\n>]{2,30})+)'),
+]
+
+# Platform hints in the text around a navigation path; app hints win
+_APP_HINT_RE = _regex.compile(r'(?i)\b(?:apps?|mobile)\b')
+_WEB_HINT_RE = _regex.compile(r'(?i)\b(?:website|browser|etsy\.com)\b')
+
+# Button names in quotes (straight or curly) or bold. Kept as separate
+# patterns for the same reason as the navigation ones: one alternative can
+# start inside another's match (a bold run holding a quoted name). The
+# curly quotes are literal characters because RE2 has no \u escapes, and
+# no-break spaces are listed explicitly because RE2's \s is ASCII-only.
+_BUTTON_PATTERNS = [
+    _regex.compile(r'(?i)(?:click|tap|select|press)[\s\xa0]+(?:the[\s\xa0]+)?["“]([^"”]+)["”]'),
+    _regex.compile(r'(?i)(?:click|tap|select|press)[\s\xa0]+(?:the[\s\xa0]+)?<(?:strong|b)>([^<]+)</(?:strong|b)>'),
+    _regex.compile(r'(?i)(?:click|tap|select|press)[\s\xa0]+(?:the[\s\xa0]+)?\*\*([^*]+)\*\*'),
+]
+
+
+# Cheap pre-check over the raw HTML; it only skips work, so it must accept
+# everything the patterns above could match. Every navigation or button
+# match needs one of the action verbs, or a '>' in the article text: written
+# as an entity, a bare '>' between tags, or any '>' after a '<' that can't
+# start a tag (text like "Settings < Foo > Privacy"). The patterns have no
+# word boundaries, so neither does this ("preselect" counts). "go" only
+# counts when something that can become whitespace follows: a space, a tag
+# or an entity. Entity-encoded letters are covered by '&#'.
+_TRIGGER_RE = _regex.compile(r'(?i)navigate|select|click|tap|open|press|go[\s\xa0<&]|&gt|&#|(?:^|>)[^<]*>|<[^a-z/!?]')
+
+
+# Elements whose content is not visible text; their tails still are
+_HIDDEN_TAGS = frozenset(("script", "style", "template"))
+
+
+def _visible_strings(node) -> Iterator[str]:
+    """Yield the visible text nodes under node, each tail as its own string."""
+    # Comments and processing instructions have a non-string tag
+    if not isinstance(node.tag, str) or node.tag in _HIDDEN_TAGS:
+        return
+    if node.text:
+        yield node.text
+    for child in node:
+        yield from _visible_strings(child)
+        if child.tail:
+            yield child.tail
+
+
+def _html_to_text(html_content: str) -> str:
+    """Flatten HTML to its visible text, one space between text nodes."""
+    try:
+        tree = lxml_html.fromstring(html_content)
+    except etree.ParserError:
+        # Empty document, e.g. blank or comment-only HTML
+        return ""
+
+    return " ".join(s for s in (text.strip() for text in _visible_strings(tree)) if s)
+
+
+@digest_lru_cache(maxsize=32)
+def _extract_ui_elements(html_content: str) -> tuple[UIElement, ...]:
+    """Extract UI elements and navigation paths from article content.
+
+    Pure function of the HTML, so repeated articles are served from the
+    cache. The cache is keyed on a digest, but the cached elements still
+    hold the article's flattened text (and its HTML, for button contexts),
+    so it only keeps a handful of articles.
+    """
+    # Nothing can match: skip the parse and the pattern scans
+    if not _TRIGGER_RE.search(html_content):
+        return ()
+
+    text = _html_to_text(html_content)
+
+    elements = []
+
+    # Navigation paths
+    for pattern in _NAV_PATTERNS:
+        for match in pattern.finditer(text):
+            path = match.group(1).strip()
+            # Get surrounding context
+            start = max(0, match.start() - 50)
+            end = min(len(text), match.end() + 50)
+
+            # Determine platform from the context, searched in place
+            platform = "unknown"
+            if _APP_HINT_RE.search(text, start, end):
+                platform = "app"
+            elif _WEB_HINT_RE.search(text, start, end):
+                platform = "web"
+
+            elements.append(UIElement(
+                text=path,
+                element_type="navigation",
+                platform=platform,
+                _text=text,
+                _ctx_start=start,
+                _ctx_end=end,
+            ))
+
+    # Button names in quotes or bold
+    for pattern in _BUTTON_PATTERNS:
+        for match in pattern.finditer(html_content):
+            button_text = match.group(1).strip()
+            if len(button_text) > 2 and len(button_text) < 50:
+                start = max(0, match.start() - 50)
+                end = min(len(html_content), match.end() + 50)
 
                 elements.append(UIElement(
-                    text=path,
-                    element_type="navigation",
-                    context=context,
-                    platform=platform
+                    text=button_text,
+                    element_type="button",
+                    platform="unknown",
+                    _text=html_content,
+                    _ctx_start=start,
+                    _ctx_end=end,
                 ))
 
-        # Pattern for button names in quotes or bold
-        button_patterns = [
-            r'(?:click|tap|select|press)\s+(?:the\s+)?["\u201c]([^"\u201d]+)["\u201d]',
-            r'(?:click|tap|select|press)\s+(?:the\s+)?<(?:strong|b)>([^<]+)</(?:strong|b)>',
-            r'(?:click|tap|select|press)\s+(?:the\s+)?\*\*([^*]+)\*\*',
-        ]
-
-        for pattern in button_patterns:
-            for match in re.finditer(pattern, html_content, re.IGNORECASE):
-                button_text = match.group(1).strip()
-                if len(button_text) > 2 and len(button_text) < 50:
-                    start = max(0, match.start() - 50)
-                    end = min(len(html_content), match.end() + 50)
-
-                    elements.append(UIElement(
-                        text=button_text,
-                        element_type="button",
-                        context=html_content[start:end],
-                        platform="unknown"
-                    ))
-
-        return elements
+    return tuple(elements)
 
-    def _check_known_element(self, element: UIElement) -> Optional[VerificationResult]:
-        """Check element against known UI elements database."""
-        element_lower = element.text.lower().strip()
-
-        # Direct match
-        if element_lower in KNOWN_UI_ELEMENTS:
-            info = KNOWN_UI_ELEMENTS[element_lower]
-            return VerificationResult(
-                element=element,
-                status="verified" if info["status"] == "current" else "potentially_outdated",
-                confidence=0.9,
-                notes=f"Matched known UI element ({info['platform']})",
-                source="known_elements_db"
-            )
-
-        # Check for outdated patterns
-        for pattern in OUTDATED_PATTERNS:
-            if re.search(pattern, element_lower):
-                return VerificationResult(
-                    element=element,
-                    status="potentially_outdated",
-                    confidence=0.7,
-                    notes=f"Matches potentially outdated pattern: {pattern}",
-                    source="outdated_patterns_db"
-                )
 
-        # Partial matches in navigation paths
-        for known, info in KNOWN_UI_ELEMENTS.items():
-            if known in element_lower or element_lower in known:
-                return VerificationResult(
-                    element=element,
-                    status="verified",
-                    confidence=0.7,
-                    notes=f"Partial match to known element: {known}",
-                    source="known_elements_db"
-                )
+@lru_cache(maxsize=4096)
+def _classify(element_lower: str) -> Optional[tuple[str, float, str, str]]:
+    """Look up lowercased element text in the known-element and outdated-phrase data.
 
-        return None
+    Returns (status, confidence, notes, source), or None if nothing matches.
+    """
+    # Direct match
+    known = _KNOWN.get(element_lower)
+    if known is not None:
+        status, platform, _type = known
+        return (
+            "verified" if status == "current" else "potentially_outdated",
+            0.9,
+            f"Matched known UI element ({platform})",
+            "known_elements_db",
+        )
+
+    # One pass over the text finds every outdated phrase and known
+    # element name it contains; the lowest index in each list wins
+    outdated_index = known_index = None
+    if element_lower:
+        for _end, hits in _PHRASE_AUTOMATON.iter(element_lower):
+            for kind, index in hits:
+                if kind == "outdated":
+                    if outdated_index is None or index < outdated_index:
+                        outdated_index = index
+                elif known_index is None or index < known_index:
+                    known_index = index
+
+    # Check for outdated patterns
+    if outdated_index is not None:
+        return (
+            "potentially_outdated",
+            0.7,
+            f"Matches potentially outdated pattern: {OUTDATED_PATTERNS[outdated_index]}",
+            "outdated_patterns_db",
+        )
+
+    # Partial matches in navigation paths: a known name inside the text
+    # (from the automaton) or the text inside a known name
+    containing_index = _KNOWN_SUBSTRINGS.get(element_lower)
+    if containing_index is not None and (known_index is None or containing_index < known_index):
+        known_index = containing_index
+
+    if known_index is not None:
+        return (
+            "verified",
+            0.7,
+            f"Partial match to known element: {_KNOWN_KEYS[known_index]}",
+            "known_elements_db",
+        )
+
+    return None
+
+
+class UIVerifier:
+    """Verifies UI elements mentioned in articles against live Etsy site."""
+
+    def _extract_ui_elements(self, html_content: str) -> list[UIElement]:
+        """Extract UI elements and navigation paths from article content."""
+        return list(_extract_ui_elements(html_content))
+
+    def _check_known_element(self, element: UIElement) -> Optional[VerificationResult]:
+        """Check element against known UI elements database."""
+        match = _classify(element.text.lower().strip())
+        if match is None:
+            return None
+        status, confidence, notes, source = match
+        return VerificationResult(
+            element=element,
+            status=status,
+            confidence=confidence,
+            notes=notes,
+            source=source
+        )
 
     def _verify_live(self, element: UIElement) -> VerificationResult:
         """
@@ -216,10 +374,11 @@ class UIVerifier:
             UIVerificationReport with all findings
         """
         elements = self._extract_ui_elements(html_content)
-        results = []
+        results = [None] * len(elements)
         manual_review_items = []
+        confidence_sum = 0.0
 
-        for element in elements:
+        for i, element in enumerate(elements):
             # First try known elements
             result = self._check_known_element(element)
 
@@ -227,7 +386,8 @@ class UIVerifier:
                 # Try live verification
                 result = self._verify_live(element)
 
-            results.append(result)
+            results[i] = result
+            confidence_sum += result.confidence
 
             # Track items needing manual review
             if result.status in ["unverified", "potentially_outdated"]:
@@ -237,7 +397,7 @@ class UIVerifier:
 
         # Calculate overall confidence
         if results:
-            overall_confidence = sum(r.confidence for r in results) / len(results)
+            overall_confidence = confidence_sum / len(results)
         else:
             overall_confidence = 1.0  # No UI elements to verify
 
@@ -248,20 +408,3 @@ class UIVerifier:
             needs_manual_review=len(manual_review_items) > 0,
             manual_review_items=manual_review_items
         )
-
-    def fetch_etsy_page(self, url: str) -> Optional[str]:
-        """
-        Fetch a public Etsy page for verification.
-
-        Args:
-            url: URL to fetch
-
-        Returns:
-            Page HTML or None if failed
-        """
-        try:
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            return response.text
-        except Exception:
-            return None
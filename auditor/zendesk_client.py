@@ -1,12 +1,53 @@
 """Zendesk Help Center API client for fetching articles."""
 
 import re
+import threading
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Optional
-import requests
+from urllib.parse import parse_qs, urlsplit
+import httpx
+import orjson
 
+from ._http import get_client, new_async_client
 
-@dataclass
+
+# Article ID in a Help Center URL: /articles/123456 or /articles/123456-article-title
+_ARTICLE_ID_RE = re.compile(r'/articles/(\d+)')
+
+# Concurrent page fetches when listing articles
+_PAGE_WORKERS = 8
+
+
+def parse_article_ref(url_or_id: str) -> tuple[int, Optional[str]]:
+    """
+    Split an article URL or numeric ID into its article ID and segment.
+
+    Args:
+        url_or_id: Article URL or numeric ID
+
+    Returns:
+        (article_id, segment); segment is None for a bare ID or a URL
+        without a segment parameter
+
+    Raises:
+        ValueError: If no article ID can be found
+    """
+    try:
+        return int(url_or_id), None
+    except ValueError:
+        pass
+
+    match = _ARTICLE_ID_RE.search(url_or_id)
+    if not match:
+        raise ValueError(f"Could not extract article ID from: {url_or_id}")
+
+    segment = parse_qs(urlsplit(url_or_id).query).get("segment")
+    return int(match.group(1)), segment[0] if segment else None
+
+
+@dataclass(slots=True, frozen=True)
 class Article:
     """Represents a Zendesk Help Center article."""
     id: int
@@ -41,32 +82,18 @@ class ZendeskClient:
             api_token: Zendesk API token
         """
         self.subdomain = subdomain
+        self.email = email
         self.base_url = f"https://{subdomain}.zendesk.com/api/v2/help_center"
         self.auth = (f"{email}/token", api_token)
-        self.session = requests.Session()
-        self.session.auth = self.auth
-        self.session.headers.update({
-            "Content-Type": "application/json",
-        })
-
-    def _extract_article_id(self, url_or_id: str) -> int:
-        """Extract article ID from URL or return the ID if already numeric."""
-        if url_or_id.isdigit():
-            return int(url_or_id)
-
-        # Match patterns like /articles/123456 or /articles/123456-article-title
-        match = re.search(r'/articles/(\d+)', url_or_id)
-        if match:
-            return int(match.group(1))
-
-        raise ValueError(f"Could not extract article ID from: {url_or_id}")
+        # Shared pooled HTTP/2 client; keep-alive and multiplexing avoid a
+        # TCP+TLS handshake per request. Credentials go with each request.
+        self.session = get_client()
 
-    def _extract_segment(self, url: str) -> Optional[str]:
-        """Extract segment parameter from URL."""
-        match = re.search(r'[?&]segment=(\w+)', url)
-        if match:
-            return match.group(1)
-        return None
+        # Section names by (section_id, locale). All sections of a locale are
+        # loaded on its first lookup, since most articles share a few sections.
+        self._section_names: dict[tuple[int, str], str] = {}
+        self._section_locales: set[str] = set()
+        self._section_lock = threading.Lock()
 
     def get_article(self, url_or_id: str, locale: str = "en-us") -> Article:
         """
@@ -79,14 +106,13 @@ class ZendeskClient:
         Returns:
             Article object with full content
         """
-        article_id = self._extract_article_id(url_or_id)
-        segment = self._extract_segment(url_or_id) if not url_or_id.isdigit() else None
+        article_id, segment = parse_article_ref(url_or_id)
 
         url = f"{self.base_url}/{locale}/articles/{article_id}"
-        response = self.session.get(url)
+        response = self.session.get(url, auth=self.auth)
         response.raise_for_status()
 
-        data = response.json()["article"]
+        data = orjson.loads(response.content)["article"]
 
         # Get section name
         section_name = None
@@ -107,47 +133,121 @@ class ZendeskClient:
             segment=segment,
         )
 
+    def _prefetch_sections(self, locale: str) -> None:
+        """Load the names of every section in a locale into the cache."""
+        data = self._get_json(f"{self.base_url}/{locale}/sections", {"per_page": 100})
+        while True:
+            for section in data["sections"]:
+                self._section_names[(section["id"], locale)] = section["name"]
+            if not data.get("next_page"):
+                break
+            data = self._get_json(data["next_page"])
+
     def _get_section_name(self, section_id: int, locale: str = "en-us") -> str:
         """Get the name of a section by ID."""
-        url = f"{self.base_url}/{locale}/sections/{section_id}"
-        response = self.session.get(url)
+        key = (section_id, locale)
+        with self._section_lock:
+            if locale not in self._section_locales:
+                # Only attempted once per locale; single lookups below still work
+                self._section_locales.add(locale)
+                try:
+                    self._prefetch_sections(locale)
+                except httpx.HTTPError:
+                    pass
+            name = self._section_names.get(key)
+
+        if name is None:
+            # Not in the prefetched list, e.g. a section created since
+            url = f"{self.base_url}/{locale}/sections/{section_id}"
+            name = self._get_json(url)["section"]["name"]
+            with self._section_lock:
+                self._section_names[key] = name
+        return name
+
+    def clear_section_cache(self) -> None:
+        """Forget cached section names so they are fetched again on next use."""
+        with self._section_lock:
+            self._section_names.clear()
+            self._section_locales.clear()
+
+    def _get_json(self, url: str, params: Optional[dict] = None) -> dict:
+        """GET a URL and return the decoded JSON body."""
+        response = self.session.get(url, params=params, auth=self.auth)
         response.raise_for_status()
-        return response.json()["section"]["name"]
+        return orjson.loads(response.content)
 
-    def list_articles(self, locale: str = "en-us", per_page: int = 30) -> list[Article]:
+    @staticmethod
+    def _article_from_listing(article_data: dict, locale: str) -> Article:
+        """Build an Article from one entry of an article list response."""
+        return Article(
+            id=article_data["id"],
+            title=article_data["title"],
+            body=article_data["body"],
+            html_url=article_data["html_url"],
+            section_id=article_data["section_id"],
+            locale=locale,
+        )
+
+    def list_articles(self, locale: str = "en-us", per_page: int = 100) -> list[Article]:
         """
         List all articles in the Help Center.
 
         Args:
             locale: Locale for articles
-            per_page: Number of articles per page
+            per_page: Number of articles per page (Zendesk allows up to 100)
 
         Returns:
             List of Article objects (without full body content initially)
         """
-        articles = []
         url = f"{self.base_url}/{locale}/articles"
-        params = {"per_page": per_page}
+        pages = [self._get_json(url, {"per_page": per_page})]
+
+        page_count = pages[0].get("page_count")
+        if page_count:
+            # The first page says how many there are, so fetch the rest
+            # concurrently over the pooled connection (results stay in order)
+            if page_count > 1:
+                with ThreadPoolExecutor(max_workers=min(_PAGE_WORKERS, page_count - 1)) as pool:
+                    pages.extend(pool.map(
+                        lambda page: self._get_json(url, {"per_page": per_page, "page": page}),
+                        range(2, page_count + 1),
+                    ))
+        else:
+            # No page count: follow next_page links one at a time
+            while pages[-1].get("next_page"):
+                pages.append(self._get_json(pages[-1]["next_page"]))
+
+        return [
+            self._article_from_listing(article_data, locale)
+            for data in pages
+            for article_data in data["articles"]
+        ]
+
+    async def iter_articles(self, locale: str = "en-us", per_page: int = 100) -> AsyncIterator[Article]:
+        """
+        Stream all articles in the Help Center, one page in memory at a time.
 
-        while url:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+        Args:
+            locale: Locale for articles
+            per_page: Number of articles per page (Zendesk allows up to 100)
 
-            for article_data in data["articles"]:
-                articles.append(Article(
-                    id=article_data["id"],
-                    title=article_data["title"],
-                    body=article_data["body"],
-                    html_url=article_data["html_url"],
-                    section_id=article_data["section_id"],
-                    locale=locale,
-                ))
+        Yields:
+            Article objects (without section names)
+        """
+        async with new_async_client(auth=self.auth) as client:
+            url = f"{self.base_url}/{locale}/articles"
+            params = {"per_page": per_page}
 
-            url = data.get("next_page")
-            params = {}  # Clear params for pagination
+            while url:
+                response = await client.get(url, params=params)
+                response.raise_for_status()
+                data = orjson.loads(response.content)
 
-        return articles
+                for article_data in data["articles"]:
+                    yield self._article_from_listing(article_data, locale)
+
+                url = data.get("next_page")
+                params = None  # next_page already carries the query
 
     def search_articles(self, query: str, locale: str = "en-us") -> list[Article]:
         """
@@ -163,11 +263,11 @@ class ZendeskClient:
         url = f"{self.base_url}/articles/search"
         params = {"query": query, "locale": locale}
 
-        response = self.session.get(url, params=params)
+        response = self.session.get(url, params=params, auth=self.auth)
         response.raise_for_status()
 
         articles = []
-        for result in response.json()["results"]:
+        for result in orjson.loads(response.content)["results"]:
             articles.append(Article(
                 id=result["id"],
                 title=result["title"],
@@ -183,7 +283,7 @@ class ZendeskClient:
         """Test if the API credentials are valid."""
         try:
             url = f"{self.base_url}/en-us/articles"
-            response = self.session.get(url, params={"per_page": 1})
+            response = self.session.get(url, params={"per_page": 1}, auth=self.auth)
             response.raise_for_status()
             return True
         except Exception: